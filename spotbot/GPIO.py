@@ -5,6 +5,7 @@ class Relay(object):
     def __init__(self, gpio: int, active_high: bool) -> None:
         self.gpio = gpio
         self.active_high = active_high
+        self._closed = False
 
         GPIO.setmode(GPIO.BCM)
         GPIO.setup(self.gpio, GPIO.OUT)
@@ -41,10 +42,13 @@ class Relay(object):
             return "Off"
 
     def close(self) -> None:
-        self.open = False
+        # safe to call more than once, run() and atexit both close the relay
+        if self._closed:
+            return
+        self._closed = True
         GPIO.cleanup()
 
     def __del__(self) -> None:
         """Catchall cleanup in case the object gets collected"""
-        if self.open is True:
-            GPIO.cleanup()
+        if getattr(self, "_closed", True) is False:
+            self.close()
@@ -340,7 +340,7 @@ class ServoController:
             # Use targets to build a structure of target blocks
             channels = sorted(targets_us.keys())
             prev_channel = first_channel = channels[0]
-            target = targets_us[first_channel]
+            target_us = targets_us[first_channel]
             # Structure: {channelM: [targetM, targetM+1, ..., targetN], ...}
             target_blocks = {first_channel: [target_us]}
             for channel in channels[1:]:
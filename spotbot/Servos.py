@@ -105,13 +105,53 @@ class Servo(object):
         self.description = description
         self.designation = designation
 
+        # last position written to (or read from) the controller, None until the
+        # first read, see position_us
+        self._position_us = None
+
+        # (value, str(value)) of the last position_us/home_deg displayed
+        self._position_us_str = (None, "")
+        self._home_deg_str = (None, "")
+
     @property
-    def position_us(self) -> int:
-        return self.servo_ctl.get_position_us(self.channel)
+    def position_us(self) -> float:
+        # reading the position is a serial round trip, only done the first time
+        # and after that whatever was last written is used
+        if self._position_us is None:
+            self.read_position_us()
+        return self._position_us
 
     @position_us.setter
-    def position_us(self, value: int):
+    def position_us(self, value: float):
+        # keep within the servo's limits so the cached position can't drift past
+        # where the servo actually stops, 0 means off and is passed through.
+        # always a float, like a position read back from the controller, as the
+        # clamp returns the int limit itself and the display would mix formats
+        if value:
+            value = min(max(value, self.min_us), self.max_us)
+        value = float(value)
         self.servo_ctl.set_target_us(self.channel, value)
+        self._position_us = value
+
+    def read_position_us(self) -> float:
+        """Read the position back from the controller, resyncing position_us"""
+        self._position_us = float(self.servo_ctl.get_position_us(self.channel))
+        return self._position_us
+
+    @property
+    def position_us_str(self) -> str:
+        """position_us for display, only converted when the position changes"""
+        value = self.position_us
+        if value != self._position_us_str[0]:
+            self._position_us_str = (value, str(value))
+        return self._position_us_str[1]
+
+    @property
+    def home_deg_str(self) -> str:
+        """home_deg for display, only converted when it changes"""
+        if self.home_deg != self._home_deg_str[0]:
+            self._home_deg_str = (self.home_deg, str(self.home_deg))
+        return self._home_deg_str[1]
 
     @property
     def position_angle(self) -> float:
@@ -125,3 +165,19 @@ class Servo(object):
 
     def stop(self) -> None:
         self.servo_ctl.stop_channel(self.channel)
+        self._position_us = 0.0
+
+    @classmethod
+    def stop_many(cls, servos) -> None:
+        """Stop several servos, in one command if the controller supports it"""
+        set_targets_us = getattr(cls.servo_ctl, "set_targets_us", None)
+        if set_targets_us is None:
+            for servo in servos:
+                servo.stop()
+        else:
+            # a target of 0 stops the PWM signal, same as stop_channel
+            targets_us = {servo.channel: 0 for servo in servos}
+            if targets_us:
+                set_targets_us(targets_us)
+            for servo in servos:
+                servo._position_us = 0.0
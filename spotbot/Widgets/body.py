@@ -5,6 +5,7 @@ from textual.message import Message, MessageTarget
 from textual.reactive import Reactive
 from textual import log
 from textual import events
+import textual.actions
 from rich.table import Table
 from rich.layout import Layout
 from rich.text import Text
@@ -13,6 +14,22 @@ from rich.panel import Panel
 from textual.reactive import Reactive
 import rich.repr
 
+# Confirmation action for the home servos binding, pre-parsed like the menu
+# callbacks so the binding doesn't go through ast.literal_eval on each press
+HOME_SERVOS_ACTION = textual.actions.parse(
+    "confirm_y_n('[b]Set servos to home position[/b] Y/N', "
+    "'set_servos_home','close_dialog', '[Home]')"
+)
+
+# Footer descriptions for the up/down bindings, by servo mode
+INCREMENT_DESCRIPTION = {"angle": "Increment ∠", "us": "Increment µs"}
+DECREMENT_DESCRIPTION = {"angle": "Decrement ∠", "us": "Decrement µs"}
+
+# parsed servo_key action for each servo letter, built once rather than per click
+SERVO_KEY_ACTIONS = {
+    key: textual.actions.parse(f"servo_key('{key}')") for key in "ABCDEFGHIJKLMNOPQR"
+}
+
 
 class Body(Static):
 
@@ -27,12 +44,7 @@ class Body(Static):
     # bindings are also managed directly and not through the BINDINGS variable
     # only leaving this here since its where people will look for BINDINGS
     BINDINGS = [
-        (
-            "equals_sign",
-            "confirm_y_n('[b]Set servos to home position[/b] Y/N', "
-            "'set_servos_home','close_dialog', '[Home]')",
-            "Home Servos",
-        ),
+        ("equals_sign", HOME_SERVOS_ACTION, "Home Servos"),
         ("m", "toggle_multi_select", "Multi-Select"),
     ]
 
@@ -67,20 +79,30 @@ class Body(Static):
         # Data to populate the tables
         self.mappings = {}
 
+        # (servoletter, table, row) for every servo in servo_layout, spacers dropped
+        self.servo_flat = tuple(
+            (servoletter, table, row)
+            for table, rows in enumerate(self.servo_layout)
+            for row, servoletter in enumerate(rows)
+            if servoletter is not None
+        )
+
+        # servoletter -> (table, row) position of the servo in servo_tables
+        self._cell_index = {
+            servoletter: (table, row) for (servoletter, table, row) in self.servo_flat
+        }
+
         # currently selected servos
         self.selection = []
 
+        # set by bind/unbind when the footer needs regenerating, see refresh_footer
+        self._bindings_dirty = False
+
         # the output text, if set to None, will generate new text.
         self._servo_text: Text | None = None
 
-        # Create BINDINGS for servo hot-keys
-        for table in self.servo_layout:
-            for row in table:
-                if row is None:
-                    continue
-                self.bind(row, f"servo_key('{row}')", "", show=False)
-                self.bind(row.lower(), f"servo_key('{row}')", "", show=False)
-
+        # pending redraw after a selection change, see queue_refresh
+        self._refresh_timer = None
 
     def __rich_repr__(self) -> rich.repr.Result:
         yield from super().__rich_repr__()
@@ -121,8 +143,33 @@ class Body(Static):
             else:
                 self.selection.clear()
         self._servo_text = None
+        self.queue_refresh()
+
+    def queue_refresh(self) -> None:
+        """Redraw the body shortly, coalescing repeats
+
+        The selection (and the bindings that depend on it) change immediately, a
+        burst of hotkey presses only rebuilds the tables once it settles.
+        """
+        if self._refresh_timer is None:
+            self._refresh_timer = self.set_timer(0.05, self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        """Redraw the body for the queued selection changes"""
+        self._refresh_timer = None
         self.refresh()
 
+    async def on_key(self, event: events.Key) -> None:
+        """Dispatch servo hotkeys, either case selects the servo
+
+        A dict lookup here replaces a binding (and an action string to parse) per
+        servo letter.
+        """
+        servoletter = event.key.upper()
+        if servoletter in self._cell_index:
+            event.stop()
+            self._action_servo_key(servoletter)
+
     def get_selection(self) -> list:
         return self.selection
 
@@ -135,40 +182,59 @@ class Body(Static):
         self._servo_text = None
         self.refresh()
 
+    def update_cells(self, mappings: dict) -> None:
+        """Update the mappings for some of the servos and refresh the widget once
+
+        If the tables are already built, only the tables holding those servos are
+        rebuilt rather than every table.
+        """
+        self.mappings.update(mappings)
+        if self._servo_text is not None:
+            tables = {self._cell_index[servoletter][0] for servoletter in mappings}
+            for table in tables:
+                self._set_servo_table(table, self._build_servo_table(table))
+        self.refresh()
+
     def make_servo_text(self) -> Text:
         self.servo_tables.clear()
         # Each entry in servo_layout represents a table of rows in the order to print
         for table in range(len(self.servo_layout)):
-            # create a new table
-            self.servo_tables.append(self._create_servo_table())
-            # for each row, fill in the values
-            for row in self.servo_layout[table]:
-                if row is None:
-                    self.servo_tables[table].add_row("", "", "", "", "")
-                    continue
-                (key, desc, servo, us, angle) = self.mappings[row]
-                column_style = "reverse" if key in self.selection else "none"
-                if self.disabled is True:
-                    key_text = f"({key.upper()})"
-                else:
-                    key_text = Text.assemble(
-                        f"({key.upper()})",
-                        meta={"@click": f"servo_key('{key}')", "key": key},
-                    )
-                self.servo_tables[table].add_row(
-                    key_text,
-                    desc,
-                    servo,
-                    us,
-                    angle,
-                    style=column_style,
-                )
-
-        self.layout["left"].update(Align(self.servo_tables[0], align="center"))
-        self.layout["right"].update(Align(self.servo_tables[1], align="center"))
+            self.servo_tables.append(None)
+            self._set_servo_table(table, self._build_servo_table(table))
 
         return self.layout
 
+    def _build_servo_table(self, table: int) -> Table:
+        """Create a table and fill in the rows for one entry of servo_layout"""
+        servo_table = self._create_servo_table()
+        for row in self.servo_layout[table]:
+            if row is None:
+                servo_table.add_row("", "", "", "", "")
+                continue
+            (key, desc, servo, us, angle) = self.mappings[row]
+            column_style = "reverse" if key in self.selection else "none"
+            if self.disabled is True:
+                key_text = f"({key.upper()})"
+            else:
+                key_text = Text.assemble(
+                    f"({key.upper()})",
+                    meta={"@click": SERVO_KEY_ACTIONS[key], "key": key},
+                )
+            servo_table.add_row(
+                key_text,
+                desc,
+                servo,
+                us,
+                angle,
+                style=column_style,
+            )
+        return servo_table
+
+    def _set_servo_table(self, table: int, servo_table: Table) -> None:
+        """Show servo_table as table number table, left or right in the layout"""
+        self.servo_tables[table] = servo_table
+        self.layout[("left", "right")[table]].update(Align(servo_table, align="center"))
+
     def render(self) -> RenderResult:
 
         if self._servo_text is None:
@@ -198,39 +264,48 @@ class Body(Static):
         # if self.menu.visible is True:
         #     return
 
-        # Get the footer to force updates
-        # hack - changing bindings not currently supported in textual
-
         # If we're "disabled" - ignore the key presses
         if self.disabled:
             return
-        footer = self.app.query_one("Footer")
 
         self.key_press(key)
         if len(self.selection) == 0:
             self.unbind("up")
             self.unbind("down")
             self.unbind("0")
-            # hack to refresh footer, changing bindings not currently in Textual
-            footer._key_text = None
-            footer.refresh()
         else:
-            symbol = "∠" if self.app.servo_mode == "angle" else "µs"
-            self.bind("up", "app.servo_increment", description=f"Increment {symbol}")
-            self.bind("down", "app.servo_decrement", description=f"Decrement {symbol}")
-            self.bind("0", "app.servo_off", description="Servo Off")
-            # hack to refresh footer, changing bindings not currently in Textual
-            footer._key_text = None
-            footer.refresh()
+            self.bind_servo_keys()
+        self.refresh_footer()
+
+    def bind_servo_keys(self) -> None:
+        """Bind the keys that act on the selected servos, for the current mode"""
+        mode = self.app.servo_mode
+        self.bind("up", "app.servo_increment", description=INCREMENT_DESCRIPTION[mode])
+        self.bind(
+            "down", "app.servo_decrement", description=DECREMENT_DESCRIPTION[mode]
+        )
+        self.bind("0", "app.servo_off", description="Servo Off")
 
     async def _action_toggle_multi_select(self) -> None:
         self.multi_select = not self.multi_select
         # Let the app know to update the Status Widget
         await self.emit(self.StatusUpdate(self))
 
-    def bind(self, *args, **kwargs) -> None:
+    def refresh_footer(self) -> None:
+        """Regenerate the footer, if bind/unbind changed the bindings since last time"""
+        if self._bindings_dirty:
+            self.app.query_one("Footer").regenerate()
+            self._bindings_dirty = False
+
+    def bind(self, keys: str, *args, **kwargs) -> None:
         """Create bind method - hack - not currently supported in Textual"""
-        self._bindings.bind(*args, **kwargs)
+        bindings = self._bindings.keys
+        keylist = [key.strip() for key in keys.split(",")]
+        before = [bindings.get(key) for key in keylist]
+        self._bindings.bind(keys, *args, **kwargs)
+        # Binding is a frozen dataclass, rebinding the same thing compares equal
+        if before != [bindings.get(key) for key in keylist]:
+            self._bindings_dirty = True
 
     def unbind(self, key: str) -> None:
         """Create unbind method - hack - not currently supported in Textual
@@ -239,6 +314,8 @@ class Body(Static):
         key : str
             key to unbind
         """
-        # Raise exception if key doesn't exist
-        self._bindings.get_key(key)
-        del self._bindings.keys[key]
+        try:
+            del self._bindings.keys[key]
+        except KeyError:
+            raise KeyError(f"No binding for key {key!r}") from None
+        self._bindings_dirty = True
@@ -5,6 +5,25 @@ from textual.reactive import Reactive
 from textual.widgets import Button, Static
 from textual.message import Message, MessageTarget
 from textual import log
+import textual.actions
+
+
+# Bindings while a dialog is shown, they never change so build them once
+_DIALOG_BINDINGS = Bindings(
+    [
+        Binding(
+            key="ctrl+c",
+            action="quit",
+            description="",
+            show=False,
+            key_display=None,
+            priority=True,
+        ),
+        # pre-parsed, these are dispatched without going through actions.parse
+        ("y", textual.actions.parse("dialog.run_confirm_binding('dialog_y')"), "Yes"),
+        ("n", textual.actions.parse("dialog.run_confirm_binding('dialog_n')"), "No"),
+    ]
+)
 
 
 class Dialog(Static):
@@ -34,6 +53,8 @@ class Dialog(Static):
         self._focuslist = []
         self._focus_save = None
         self._bindings_stack = []
+        # Bindings installed while the dialog is shown, reused from show to show
+        self._dialog_bindings = Bindings()
 
         # Allow the application to access actions in this namespace
         self.app._action_targets.add("dialog")
@@ -96,19 +117,12 @@ class Dialog(Static):
     def _override_bindings(self):
         """Force bindings for the dialog"""
         self._bindings_stack.append(self.app._bindings)
-        newbindings = [
-            Binding(
-                key="ctrl+c",
-                action="quit",
-                description="",
-                show=False,
-                key_display=None,
-                priority=True,
-            ),
-            ("y", "dialog.run_confirm_binding('dialog_y')", "Yes"),
-            ("n", "dialog.run_confirm_binding('dialog_n')", "No"),
-        ]
-        self.app._bindings = Bindings(newbindings)
+        # reset the keys from the template so an app.bind() made while the dialog
+        # was last up doesn't stick, the Binding objects themselves are immutable
+        bindings = self._dialog_bindings
+        bindings.keys.clear()
+        bindings.keys.update(_DIALOG_BINDINGS.keys)
+        self.app._bindings = bindings
 
     async def _action_run_confirm_binding(self, answer: str):
         """When someone presses a button, directly run the associated binding"""
@@ -131,8 +145,9 @@ class Dialog(Static):
     def _override_focus(self):
         """remove focus for everything, force it to the dialog"""
         self._focus_save = self.app.focused
-        for widget in self.app.screen.focus_chain:
-            self._focuslist.append(widget)
+        focus_chain = list(self.app.screen.focus_chain)
+        self._focuslist.extend(focus_chain)
+        for widget in focus_chain:
             widget.can_focus = False
         self.can_focus = True
         self.focus()
@@ -140,8 +155,9 @@ class Dialog(Static):
 
     def _restore_focus(self):
         """restore focus to what it was before we stole it"""
-        while len(self._focuslist) > 0:
-            self._focuslist.pop().can_focus = True
+        for widget in self._focuslist:
+            widget.can_focus = True
+        self._focuslist.clear()
         if self._focus_save is not None:
             self.app.set_focus(self._focus_save)
         self.emit_no_wait(self.FocusMessage(self, focustaken=False))
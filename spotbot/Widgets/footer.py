@@ -0,0 +1,124 @@
+from collections import defaultdict
+from textual.widgets import Footer as TextualFooter
+from rich.style import Style
+from rich.text import Text
+
+
+class Footer(TextualFooter):
+    """Footer that caches the Text for each binding between regenerations
+
+    The stock Footer rebuilds the Text for every binding whenever the key under
+    the mouse changes, or whenever _key_text is cleared to pick up new bindings.
+    Here a hover change only restyles the spans of the old and the new hovered
+    key in place, and when the text does need regenerating each binding's
+    fragment is cached keyed on everything that affects how it looks.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # (key, key_display, description, hovered) -> Text fragment
+        self._binding_cache: dict[tuple, Text] = {}
+        # (key, description, highlight key, highlight description) Styles, resolved
+        # from the component classes on first use rather than per binding
+        self._styles: tuple[Style, Style, Style, Style] | None = None
+        # key -> index into _key_text.spans of that binding's key and description
+        # spans, so a hover change can restyle them without rebuilding the text
+        self._span_index_by_key: dict[str, int] = {}
+
+    def watch_highlight_key(self, old: str | None, new: str | None) -> None:
+        """Restyle the previously and newly hovered bindings in place"""
+        if self._key_text is None or self._styles is None:
+            return
+        spans = self._key_text.spans
+        for key, hovered in ((old, False), (new, True)):
+            index = self._span_index_by_key.get(key)
+            if index is None:
+                continue
+            key_style, description_style = (
+                self._styles[2:] if hovered else self._styles[:2]
+            )
+            spans[index] = spans[index]._replace(style=key_style)
+            spans[index + 1] = spans[index + 1]._replace(style=description_style)
+
+    def regenerate(self) -> None:
+        """Rebuild the footer text to pick up changed bindings"""
+        # hack - changing bindings not currently supported in Textual
+        self._key_text = None
+        self.refresh()
+
+    def make_key_text(self) -> Text:
+        """Create text containing all the keys."""
+        text = Text(
+            style=self.rich_style,
+            no_wrap=True,
+            overflow="ellipsis",
+            justify="left",
+            end="",
+        )
+
+        bindings = [
+            binding
+            for (_namespace, binding) in self.app.namespace_bindings.values()
+            if binding.show
+        ]
+
+        self._span_index_by_key.clear()
+
+        action_to_bindings = defaultdict(list)
+        for binding in bindings:
+            action_to_bindings[binding.action].append(binding)
+
+        for action, bindings in action_to_bindings.items():
+            binding = bindings[0]
+            if binding.key_display is None:
+                key_display = self.app.get_key_display(binding.key)
+                if key_display is None:
+                    key_display = binding.key.upper()
+            else:
+                key_display = binding.key_display
+            hovered = self.highlight_key == binding.key
+
+            cache_key = (binding.key, key_display, binding.description, hovered)
+            key_text = self._binding_cache.get(cache_key)
+            if key_text is None:
+                key_text = self._make_binding_text(
+                    binding.key, key_display, binding.description, hovered
+                )
+                self._binding_cache[cache_key] = key_text
+            # the fragment's key and description spans land at the end of the list
+            self._span_index_by_key[binding.key] = len(text.spans)
+            text.append_text(key_text)
+        return text
+
+    def _make_binding_text(
+        self, key: str, key_display: str, description: str, hovered: bool
+    ) -> Text:
+        """Build the Text fragment for a single binding"""
+        if self._styles is None:
+            self._styles = (
+                self.get_component_rich_style("footer--key"),
+                self.rich_style,
+                self.get_component_rich_style("footer--highlight-key"),
+                self.get_component_rich_style("footer--highlight"),
+            )
+        if hovered:
+            key_style, description_style = self._styles[2:]
+        else:
+            key_style, description_style = self._styles[:2]
+        # append + apply_meta skips the tuple/Span juggling inside Text.assemble
+        key_text = Text()
+        key_text.append(f" {key_display} ", style=key_style)
+        key_text.append(f" {description} ", style=description_style)
+        key_text.apply_meta(
+            {
+                "@click": f"app.check_bindings('{key}')",
+                "key": key,
+            }
+        )
+        return key_text
+
+    def _on_styles_updated(self) -> None:
+        # cached fragments carry the old styles
+        self._binding_cache.clear()
+        self._styles = None
+        super()._on_styles_updated()
@@ -2,7 +2,7 @@ from typing import Union, Tuple, List, Optional, Callable
 from textual.widgets import Static
 from textual.app import App
 from textual.reactive import Reactive
-from textual.binding import Bindings
+from textual.binding import Binding, Bindings
 from textual.message import Message, MessageTarget
 from textual import log
 import textual.actions
@@ -13,8 +13,23 @@ from rich.style import StyleType, Style
 from rich.text import Text
 
 
+# action already run through textual.actions.parse: (action name, params)
+parsedaction = Tuple[str, Tuple[object, ...]]
+
 # type vector for easier reading (bindchar, description, callback)
-menuitem = Tuple[Union[str, Text], Union[str, Text], str]
+menuitem = Tuple[Union[str, Text], Union[str, Text], Union[str, parsedaction]]
+
+# Navigation keys bound for every menu
+_NAV_BINDINGS = {
+    key: Binding(key, action, "", show=False)
+    for (key, action) in (
+        ("escape", "menu_escape"),
+        (".", "menu_escape"),
+        ("down", "menu_down"),
+        ("up", "menu_up"),
+        ("enter", "menu_enter"),
+    )
+}
 
 
 class MenuItemList(object):
@@ -26,10 +41,45 @@ class MenuItemList(object):
         self.title = Text.from_markup(title)
 
         # Ensure that the description fields are Text type, this allows for proper
-        # length calculation with len()
+        # length calculation with len().  Callback strings are parsed here, once,
+        # Textual dispatches a parsed (name, params) action directly from bindings,
+        # clicks and App.action() rather than re-parsing the string every time.
         for index, item in enumerate(items):
-            if item is not None and isinstance(item[1], Text) is False:
-                items[index] = (item[0], Text.from_markup(item[1]), item[2])
+            if item is None:
+                continue
+            (bind_chr, description, callback) = item
+            if isinstance(description, Text) is False:
+                description = Text.from_markup(description)
+            if isinstance(callback, str):
+                callback = textual.actions.parse(callback)
+            items[index] = (bind_chr, description, callback)
+
+        # Hotkeys are bound in both cases, build the Bindings once rather than
+        # every time the menu is bound
+        self.bindings = {}
+        for item in items:
+            if item is None:
+                continue
+            for key in (str(item[0]).lower(), str(item[0]).upper()):
+                self.bindings[key] = Binding(key, item[2], "")
+
+
+class _MenuFrame(object):
+    """Menu state saved on the menu stack by load_menu and restored by pop_menu"""
+
+    __slots__ = ("menuname", "items", "title", "bindings")
+
+    def __init__(
+        self,
+        menuname: str | None,
+        items: List[menuitem],
+        title: Union[str, Text],
+        bindings: Bindings,
+    ) -> None:
+        self.menuname = menuname
+        self.items = items
+        self.title = title
+        self.bindings = bindings
 
 
 class MenuBook(object):
@@ -98,6 +148,9 @@ class Menu(Static):
         self.refresh_callback = refresh_callback
         self.max_size = max_size
 
+        # pre-built table rows for the current menu, see _build_rows()
+        self._build_rows()
+
         # keep an internal menubook
         self.menubook = MenuBook()
 
@@ -164,7 +217,7 @@ class Menu(Static):
         # push current menu and bindings onto the stack
         # the pre-menu state will have menuname = None
         self._menu_stack.append(
-            (self.menuname, self._menu_items, self.title, self.app._bindings)
+            _MenuFrame(self.menuname, self._menu_items, self.title, self.app._bindings)
         )
 
         # build and show the new menu
@@ -172,6 +225,7 @@ class Menu(Static):
             menu = MenuItemList(menuname, menu, title)
 
         self._menu_items = menu.items
+        self._menu_bindings = menu.bindings
         self.title = menu.title
         self.menuname = menu.name
 
@@ -180,6 +234,7 @@ class Menu(Static):
 
         # Bind the hotkeys in the new menu
         self._bind_current_menu()
+        self._build_rows()
 
         # Resize and show the menu
         self._resize_menu()
@@ -221,27 +276,35 @@ class Menu(Static):
             longest_desc_len if longest_desc_len < self.max_size else self.max_size
         )
 
+    def _build_rows(self) -> None:
+        """Build the table rows for the current menu once, render() just picks them
+
+        Each row is (clickable key text, plain key text, description), or None for
+        a separator.  The plain key text is used for the highlighted row.
+        """
+        self._base_rows = []
+        for item in self._menu_items:
+            if item is None:
+                self._base_rows.append(None)
+                continue
+            (bind_chr, description, callback) = item
+            key_text = Text.assemble(f"({bind_chr})", meta={"@click": callback})
+            self._base_rows.append((key_text, f"({bind_chr})", description))
+
     def _bind_current_menu(self) -> None:
         # Rebind hotkeys to new menu
         self.app._bindings = Bindings()
         # self.app.bind("ctrl+c", "quit", show=False)
-        self.bind("escape", "menu_escape", show=False)
-        self.bind(".", "menu_escape", show=False)
-        self.bind("down", "menu_down", show=False)
-        self.bind("up", "menu_up", show=False)
-        self.bind("enter", "menu_enter", show=False)
-        for item in self._menu_items:
-            if item is None:
-                continue
-            (chr, description, callback) = item
-            self.bind(chr.lower(), callback)
-            self.bind(chr.upper(), callback)
+        # hack - adding bindings not currently supported in Textual
+        self._bindings.keys.update(_NAV_BINDINGS)
+        self._bindings.keys.update(self._menu_bindings)
 
     def _override_focus(self):
         """remove focus for everything, force it to the dialog"""
         self._focus_save = self.app.focused
-        for widget in self.app.screen.focus_chain:
-            self._focuslist.append(widget)
+        focus_chain = list(self.app.screen.focus_chain)
+        self._focuslist.extend(focus_chain)
+        for widget in focus_chain:
             widget.can_focus = False
         self.can_focus = True
         self.focus()
@@ -249,33 +312,34 @@ class Menu(Static):
 
     def _restore_focus(self):
         """restore focus to what it was before we stole it"""
-        while len(self._focuslist) > 0:
-            self._focuslist.pop().can_focus = True
+        for widget in self._focuslist:
+            widget.can_focus = True
+        self._focuslist.clear()
         if self._focus_save is not None:
             self.app.set_focus(self._focus_save)
         self.emit_no_wait(self.FocusMessage(self, focustaken=False))
 
+    def _restore_frame(self, frame: _MenuFrame) -> None:
+        """Make the menu saved in frame the current one"""
+        self.menuname = frame.menuname
+        self._menu_items = frame.items
+        self.title = frame.title
+        self.app._bindings = frame.bindings
+
     async def pop_menu(self, pop_all=False) -> None:
         """Recover last menu and bindings"""
         if pop_all is True:
             """pop all until at the bottom"""
-            while self.menuname is not None:
-                (
-                    self.menuname,
-                    self._menu_items,
-                    self.title,
-                    self.app._bindings,
-                ) = self._menu_stack.pop()
+            # only the bottom (pre-menu) frame is kept, drop the rest in one go
+            if self._menu_stack:
+                self._restore_frame(self._menu_stack[0])
+                self._menu_stack.clear()
         else:
-            (
-                self.menuname,
-                self._menu_items,
-                self.title,
-                self.app._bindings,
-            ) = self._menu_stack.pop()
+            self._restore_frame(self._menu_stack.pop())
 
         self.skip_rows = 0
         self._resize_menu()
+        self._build_rows()
         self.index = 0
 
         if self.menuname is None:
@@ -289,10 +353,11 @@ class Menu(Static):
     async def action_menu_enter(self) -> None:
         if self.index == 0:
             return None
-        if self._menu_items[self.index - 1][2][:3] == "app":
-            await self.app.action(self._menu_items[self.index - 1][2])
+        callback = self._menu_items[self.index - 1][2]
+        if callback[0][:3] == "app":
+            await self.app.action(callback)
         else:
-            await self.action(self._menu_items[self.index - 1][2])
+            await self.action(callback)
 
     def action_load_menu(self, menuname: str) -> None:
         self.load_menu(menuname)
@@ -369,24 +434,20 @@ class Menu(Static):
             else:
                 subtitle = "▼▲ more ▼▲"
 
-        for count, item in enumerate(self._menu_items):
-            # Account for scrolling
-            if count < self.skip_rows:
-                continue
-            if item is None:
+        # only rows from skip_rows down can be seen, anything past the bottom is
+        # cropped by the panel
+        if len(self._menu_items) > menu_max_rows:
+            last_row = min(self.skip_rows + max(menu_max_rows, 0), len(self._base_rows))
+        else:
+            last_row = len(self._base_rows)
+        for count in range(self.skip_rows, last_row):
+            row = self._base_rows[count]
+            if row is None:
                 menu_table.add_row("", "")
+            elif self.index == (count + 1):
+                menu_table.add_row(row[1], "", row[2], style="reverse")
             else:
-                (bind_chr, description, callback) = item
-                if self.index == (count + 1):
-                    menu_table.add_row(
-                        f"({bind_chr})", "", description, style="reverse"
-                    )
-                else:
-                    key_text = Text.assemble(
-                        f"({bind_chr})",
-                        meta={"@click": callback},
-                    )
-                    menu_table.add_row(key_text, "", description)
+                menu_table.add_row(row[0], "", row[2])
         menu = Panel(
             menu_table,
             title=self.title,
@@ -6,16 +6,74 @@ from rich.text import Text
 from rich.style import StyleType, Style
 from rich.padding import Padding
 from rich.console import RenderableType
-from typing import Union, Callable
+from typing import Union, Callable, Iterator
+from contextlib import contextmanager
+
+
+class _Entry(object):
+    """A single status entry, slotted for fast attribute access in render()"""
+
+    __slots__ = (
+        "keymsg",
+        "key_style",
+        "value",
+        "value_style",
+        "value_is_callable",
+        "segment_value",
+        "segment",
+    )
+
+    def __init__(
+        self,
+        keymsg: RenderableType,
+        key_style: StyleType,
+        value: RenderableType | Callable,
+        value_style: StyleType,
+    ) -> None:
+        self.keymsg = keymsg
+        self.key_style = key_style
+        self.value = value
+        self.value_style = value_style
+        # isinstance(x, Callable) goes through the ABC machinery, check it once here
+        self.value_is_callable = callable(value)
+        # last value rendered and the "key: value" Text built for it
+        self.segment_value = None
+        self.segment: Text | None = None
+
+    def render_segment(self, value: RenderableType) -> Text:
+        """Text for this entry showing value, reused while the value is unchanged"""
+        if self.segment is None or value != self.segment_value:
+            segment = Text()
+            # If it's a str, treat it as markup
+            if isinstance(self.keymsg, str):
+                segment.append_text(Text.from_markup(self.keymsg, style=self.key_style))
+            else:
+                segment.append_text(self.keymsg)
+            segment.append(": ")
+            if isinstance(value, str):
+                segment.append_text(Text.from_markup(value, style=self.value_style))
+            else:
+                segment.append_text(value)
+            self.segment_value = value
+            self.segment = segment
+        return self.segment
 
 
 class Status(Static):
 
     # Hold dict of statuses to report on
     _entries = {}
+    # Flat list of the entries above, rebuilt on add/update, iterated by render()
+    _entries_list = []
     message: RenderableType | None = None
     _regenerate_status_from_dict: Reactive(bool) = Reactive(False)
     status_stack = []  # stack of status settings
+    # set inside batch_update(), defers rebuilding _entries_list to the end
+    _batching = False
+    # _entries_list and the entry values the current message was built from, lets
+    # update_status() skip the redraw when nothing shown has changed
+    _rendered_entries: list | None = None
+    _rendered_values: list | None = None
 
     COMPONENT_CLASSES = {
         "status--highlight-key-style",
@@ -40,7 +98,9 @@ class Status(Static):
     ) -> None:
         value_style = self.get_component_rich_style("status--value-style")
         key_style = self.get_component_rich_style("status--key-style")
-        self._entries[key] = (keymsg, key_style, value, value_style)
+        self._entries[key] = _Entry(keymsg, key_style, value, value_style)
+        if not self._batching:
+            self._entries_list = list(self._entries.values())
 
     def update_entry(
         self,
@@ -61,7 +121,7 @@ class Status(Static):
         hightlight_key: bool
             Should the key/value be highlighted
         """
-        (keymsg, old_keystyle, old_value, old_valstyle) = self._entries[key]
+        entry = self._entries[key]
 
         if not isinstance(highlight_key, Style):
             value_style = (
@@ -78,11 +138,38 @@ class Status(Static):
             )
 
         if value is None:
-            value = old_value
+            value = entry.value
+
+        self._entries[key] = _Entry(entry.keymsg, key_style, value, value_style)
+        if not self._batching:
+            self._entries_list = list(self._entries.values())
+
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """Group several add_entry/update_entry calls into one status update"""
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            self._entries_list = list(self._entries.values())
+            self.update_status()
 
-        self._entries[key] = (keymsg, key_style, value, value_style)
+    def _entry_values(self) -> list:
+        """Current value of each entry, calling the value generators"""
+        return [
+            entry.value() if entry.value_is_callable else entry.value
+            for entry in self._entries_list
+        ]
 
     def update_status(self) -> None:
+        # entries are replaced (and the list rebuilt) on add/update, so an
+        # unchanged list plus unchanged values means the message is still current
+        if (
+            self._entries_list is self._rendered_entries
+            and self._entry_values() == self._rendered_values
+        ):
+            return
         self._regenerate_status_from_dict = True
 
     def render(self) -> RenderableType:
@@ -95,22 +182,16 @@ class Status(Static):
                 end="",
             )
             # Build the statuses
+            values = self._entry_values()
+            self._rendered_entries = self._entries_list
+            self._rendered_values = values
             count = 0
-            for (keymsg, key_style, value, value_style) in self._entries.values():
+            for entry, value in zip(self._entries_list, values):
                 if count > 0:
                     # Print a seperator between items
                     self.message.append(" | ")
                 count += 1
-                # If it's a str, treat it as markup
-                if isinstance(keymsg, str):
-                    self.message.append_text(Text.from_markup(keymsg, style=key_style))
-                else:
-                    self.message.append_text(keymsg)
-                self.message.append(": ")
-                if isinstance(value, Callable):
-                    value = value()
-                if isinstance(value, str):
-                    value = Text.from_markup(value, style=value_style)
-                self.message.append_text(value)
+                # only entries whose value changed parse their markup again
+                self.message.append_text(entry.render_segment(value))
         self._regenerate_status_from_dict = False
         return Padding(self.message, pad=(0, 1, 0, 2), expand=True)
@@ -1,58 +1,67 @@
 from .Widgets.menu import Menu
 
+# Menu definitions are static, build them once at import.  MenuItemList converts
+# the descriptions in place, so add_menus() hands it a fresh list of each.
+_MAIN_MENU = (
+    ("C", "Toggle Config Mode", "app.toggle_config_mode"),
+    ("I", "Change increment µs", "load_menu('us_increment')"),
+    ("N", "Change increment ∠", "load_menu('angle_increment')"),
+    ("M", "Swich Mode µs/∠", "app.toggle_servo_mode"),
+    ("R", "Read Servo Positions", "app.read_servo_positions"),
+    None,
+    ("L", "Load Config", "tbd"),
+    ("S", "Save Config", "app.save_servo_config"),
+    None,
+    ("D", "Set Speed", "tbd"),
+    ("A", "Set Acceleration", "tbd"),
+    ("E", "Sequence Menu", "tbd"),
+    ("Q", "<-- Back", "menu_backout"),
+)
+
+_US_INCREMENT_MENU = (
+    ("1", "1 µs", "app.set_us_increment(1)"),
+    ("2", "2 µs", "app.set_us_increment(2)"),
+    ("5", "5 µs", "app.set_us_increment(5)"),
+    ("x", "10 µs", "app.set_us_increment(10)"),
+    ("b", "20 µs", "app.set_us_increment(20)"),
+    ("l", "50 µs", "app.set_us_increment(50)"),
+    ("c", "100 µs", "app.set_us_increment(100)"),
+    ("d", "200 µs", "app.set_us_increment(200)"),
+    None,
+    ("Q", "<-- Back", "menu_backout"),
+)
+
+_ANGLE_INCREMENT_MENU = (
+    ("0", ".5°", "app.set_angle_increment(0.5)"),
+    ("1", "1°", "app.set_angle_increment(1.0)"),
+    ("2", "2°", "app.set_angle_increment(2.0)"),
+    ("5", "5°", "app.set_angle_increment(5.0)"),
+    ("x", "10°", "app.set_angle_increment(10.0)"),
+    (
+        "b",
+        "[bold][underline][italics][magenta]20°[/bold][/underline][/italics][/magenta]",
+        "set_angle_increment(20.0)",
+    ),
+    ("c", "45°", "app.set_angle_increment(45.0)"),
+    ("d", "90°", "app.set_angle_increment(90.0)"),
+    None,
+    ("Q", "<-- Back", "menu_backout"),
+)
+
 
 def add_menus(menuwidget: Menu) -> None:
     menuwidget.add_menu(
         "main",
-        [
-            ("C", "Toggle Config Mode", "app.toggle_config_mode"),
-            ("I", "Change increment µs", "load_menu('us_increment')"),
-            ("N", "Change increment ∠", "load_menu('angle_increment')"),
-            ("M", "Swich Mode µs/∠", "app.toggle_servo_mode"),
-            None,
-            ("L", "Load Config", "tbd"),
-            ("S", "Save Config", "app.save_servo_config"),
-            None,
-            ("D", "Set Speed", "tbd"),
-            ("A", "Set Acceleration", "tbd"),
-            ("E", "Sequence Menu", "tbd"),
-            ("Q", "<-- Back", "menu_backout"),
-        ],
+        list(_MAIN_MENU),
         title="[bold][u]Main Menu[/u][/bold]",
     )
     menuwidget.add_menu(
         "us_increment",
-        [
-            ("1", "1 µs", "app.set_us_increment(1)"),
-            ("2", "2 µs", "app.set_us_increment(2)"),
-            ("5", "5 µs", "app.set_us_increment(5)"),
-            ("x", "10 µs", "app.set_us_increment(10)"),
-            ("b", "20 µs", "app.set_us_increment(20)"),
-            ("l", "50 µs", "app.set_us_increment(50)"),
-            ("c", "100 µs", "app.set_us_increment(100)"),
-            ("d", "200 µs", "app.set_us_increment(200)"),
-            None,
-            ("Q", "<-- Back", "menu_backout"),
-        ],
+        list(_US_INCREMENT_MENU),
         title="[bold][u]Servo Increment (µs)[u][/bold]",
     )
     menuwidget.add_menu(
         "angle_increment",
-        [
-            ("0", ".5°", "app.set_angle_increment(0.5)"),
-            ("1", "1°", "app.set_angle_increment(1.0)"),
-            ("2", "2°", "app.set_angle_increment(2.0)"),
-            ("5", "5°", "app.set_angle_increment(5.0)"),
-            ("x", "10°", "app.set_angle_increment(10.0)"),
-            (
-                "b",
-                "[bold][underline][italics][magenta]20°[/bold][/underline][/italics][/magenta]",
-                "set_angle_increment(20.0)",
-            ),
-            ("c", "45°", "app.set_angle_increment(45.0)"),
-            ("d", "90°", "app.set_angle_increment(90.0)"),
-            None,
-            ("Q", "<-- Back", "menu_backout"),
-        ],
+        list(_ANGLE_INCREMENT_MENU),
         title="[bold][underline]Servo [magenta]Increment[/magenta] (∠)[/underline][/bold]",
     )
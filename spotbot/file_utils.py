@@ -1,74 +1,200 @@
+from concurrent.futures import ThreadPoolExecutor
 from ruamel.yaml import YAML
-from schema import Schema, SchemaError, Or, And, Regex, Optional
+from schema import Schema, SchemaError, Or, Optional
 from datetime import datetime
-import serial
+from pathlib import Path
+from types import MappingProxyType
+import io
+import json
+import os
+import re
 import sys
 from . import Servos
 
 
-class ConfigFile(object):
+# YAML instances are reused across loads and saves (sequentially, never shared
+# between threads).  Loading always goes through the safe loader, which is backed
+# by libyaml (when ruamel.yaml.clib is available).  Round-trip mode is only used
+# by ServoConfiFile.save() which needs the comments preserved.
+_YAML = YAML()
+_YAML_SAFE = YAML(typ="safe")
+
+_LETTERMAP_RE = re.compile(r"^[A-R]$")
 
-    defaults = {
+# Serial defaults, same values as pyserial's PARITY_NONE, STOPBITS_ONE and
+# EIGHTBITS.  Spelled out so loading a config doesn't have to import pyserial, the
+# servo library imports it when the port is actually opened.
+_PARITY_NONE = "N"
+_STOPBITS_ONE = 1
+_EIGHTBITS = 8
+
+# read-only, shared by the schema and ConfigFile.defaults
+_CONFIG_DEFAULTS = MappingProxyType(
+    {
         "tty": "/dev/ttyS0",
         "baudrate": 9600,
-        "parity": serial.PARITY_NONE,
-        "stopbits": serial.STOPBITS_ONE,
-        "bytesize": serial.EIGHTBITS,
+        "parity": _PARITY_NONE,
+        "stopbits": _STOPBITS_ONE,
+        "bytesize": _EIGHTBITS,
         "timeout": None,
         "servo_config": "servo_config.yml",
         "pose_config": "pose_config.yml",
     }
+)
+
+
+# Schemas are input-independent, build them once at import rather than per load
+_CONFIG_SCHEMA = Schema(
+    {
+        "servoboard": str,
+        Optional("servo_config", default=_CONFIG_DEFAULTS["servo_config"]): str,
+        Optional("pose_config", default=_CONFIG_DEFAULTS["pose_config"]): str,
+        "serial_settings": {
+            Optional("tty", default=_CONFIG_DEFAULTS["tty"]): str,
+            Optional("baudrate", default=_CONFIG_DEFAULTS["baudrate"]): Or(
+                10,
+                300,
+                600,
+                1200,
+                2400,
+                4800,
+                9600,
+                14400,
+                19200,
+                38400,
+                57600,
+                115200,
+                128000,
+                256000,
+            ),
+            Optional("parity", default=_CONFIG_DEFAULTS["parity"]): Or("N", "E", "O"),
+            Optional("stopbits", default=_CONFIG_DEFAULTS["stopbits"]): Or(1, 2),
+            Optional("bytesize", default=_CONFIG_DEFAULTS["bytesize"]): Or(7, 8),
+            Optional("timeout", default=_CONFIG_DEFAULTS["timeout"]): Or(float, None),
+        },
+        Optional("relay_settings"): {
+            "gpio": int,
+            "active_high": bool,
+        },
+    }
+)
+
+_US_ERROR = "_us entries need to be between 300 and 3000"
+_DEG_ERROR = "_deg entries need to be between 0.0 and 180.0"
+
+# Checks for a single servo entry, field -> (type, low, high, error).  For the
+# str fields the bounds apply to the length.  The lettermap keys are checked
+# separately so entries can be validated and built into Servo objects in the
+# same pass.
+_SERVO_FIELD_SPECS = {
+    "channel": (int, 0, 17, "channel needs to be between 0 and 17"),
+    "designation": (str, 0, 4, "designation too long <5 characters"),
+    "description": (str, 0, 29, "description too long, <30 characters"),
+    "max_us": (int, 300, 3000, _US_ERROR),
+    "min_us": (int, 300, 3000, _US_ERROR),
+    "max_deg": (float, 0.0, 180.0, _DEG_ERROR),
+    "min_deg": (float, 0.0, 180.0, _DEG_ERROR),
+    "angle1_us": (int, 300, 3000, _US_ERROR),
+    "angle1_deg": (float, 0.0, 180.0, _DEG_ERROR),
+    "angle2_us": (int, 300, 3000, _US_ERROR),
+    "angle2_deg": (float, 0.0, 180.0, _DEG_ERROR),
+    "home_deg": (float, 0.0, 180.0, _DEG_ERROR),
+}
+_SERVO_OPTIONAL_FIELDS = frozenset(("max_deg", "min_deg"))
+
+# Stored in the servo config cache, a cache with any other version is ignored.
+# Bump whenever _SERVO_FIELD_SPECS or _validate_servo_entry change, so entries
+# validated under the old rules get validated again.
+_CACHE_VERSION = 2
+
+
+def _validate_servo_entry(configfile: str, lettermap, entry) -> None:
+    """Check a single servo entry, exits with a message if it is invalid"""
+    if not isinstance(lettermap, str) or _LETTERMAP_RE.match(lettermap) is None:
+        sys.exit(f"{configfile}: lettermap needs to be A through R")
+    if not isinstance(entry, dict):
+        sys.exit(f"{configfile}: {lettermap}: expected a mapping of servo settings")
+    for field in entry:
+        if field not in _SERVO_FIELD_SPECS:
+            sys.exit(f"{configfile}: {lettermap}: unexpected key {field!r}")
+    for field, (typ, lo, hi, error) in _SERVO_FIELD_SPECS.items():
+        try:
+            x = entry[field]
+        except KeyError:
+            if field in _SERVO_OPTIONAL_FIELDS:
+                continue
+            sys.exit(f"{configfile}: {lettermap}: missing key {field!r}")
+        # bool is a subclass of int, schema didn't accept it as one either
+        if not isinstance(x, typ) or isinstance(x, bool):
+            sys.exit(f"{configfile}: {lettermap}: {error}")
+        if not lo <= (len(x) if typ is str else x) <= hi:
+            sys.exit(f"{configfile}: {lettermap}: {error}")
+
+
+# Servo attributes written back to the servo config by ServoConfiFile.save()
+_SAVE_FIELDS = (
+    "channel",
+    "description",
+    "designation",
+    "max_us",
+    "min_us",
+    "max_deg",
+    "min_deg",
+    "home_deg",
+    "angle1_us",
+    "angle1_deg",
+    "angle2_us",
+    "angle2_deg",
+)
+
+
+def _stamp(stat: os.stat_result) -> list:
+    """Identify a version of a file, as recorded in the servo config cache"""
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def read_stamped(file: str) -> tuple[bytes, list]:
+    """Read a file, returning its contents and the stamp of the version read
+
+    The stamp is taken from the open handle before reading, so an edit made
+    while (or after) the file is read leaves the stamp older than the file and a
+    cache built from these contents is never mistaken for a newer version.
+    """
+    with open(file, "rb") as f:
+        stamp = _stamp(os.fstat(f.fileno()))
+        return f.read(), stamp
+
+
+def read_files(*files: str) -> list[tuple[bytes, list]]:
+    """Read several files concurrently so their disk latency overlaps
+
+    Returns (contents, stamp) for each file, in the order given.  The contents
+    can be fed to ConfigFile via its data parameter, ServoConfiFile takes the
+    whole pair.
+    """
+    with ThreadPoolExecutor(max_workers=len(files)) as pool:
+        return list(pool.map(read_stamped, files))
+
+
+class ConfigFile(object):
 
-    def __init__(self, configfile: str) -> None:
+    __slots__ = ("configfile", "config")
+
+    defaults = _CONFIG_DEFAULTS
+
+    def __init__(self, configfile: str, data: bytes | None = None) -> None:
         self.configfile = configfile
-        self.config = self.load()
-
-    def load(self) -> dict:
-        yaml = YAML()
-
-        with open(self.configfile) as fd:
-            config = yaml.load(fd)
-
-        config_schema = Schema(
-            {
-                "servoboard": str,
-                Optional("servo_config", default=self.defaults["servo_config"]): str,
-                Optional("pose_config", default=self.defaults["pose_config"]): str,
-                "serial_settings": {
-                    Optional("tty", default=self.defaults["tty"]): str,
-                    Optional("baudrate", default=self.defaults["baudrate"]): Or(
-                        10,
-                        300,
-                        600,
-                        1200,
-                        2400,
-                        4800,
-                        9600,
-                        14400,
-                        19200,
-                        38400,
-                        57600,
-                        115200,
-                        128000,
-                        256000,
-                    ),
-                    Optional("parity", default=self.defaults["parity"]): Or(
-                        "N", "E", "O"
-                    ),
-                    Optional("stopbits", default=self.defaults["stopbits"]): Or(1, 2),
-                    Optional("bytesize", default=self.defaults["bytesize"]): Or(7, 8),
-                    Optional("timeout", default=self.defaults["timeout"]): Or(
-                        float, None
-                    ),
-                },
-                Optional("relay_settings"): {
-                    "gpio": int,
-                    "active_high": bool,
-                },
-            }
-        )
+        self.config = self.load(data)
+
+    def load(self, data: bytes | None = None) -> dict:
+        """Load and validate the config, data is the already-read file if any"""
+        if data is None:
+            # one buffered read, then parse from memory
+            data = Path(self.configfile).read_bytes()
+        config = _YAML_SAFE.load(data)
+
         try:
-            config = config_schema.validate(config)
+            config = _CONFIG_SCHEMA.validate(config)
         except SchemaError as se:
             sys.exit(f"{self.configfile}: {se.code}")
 
@@ -76,130 +202,132 @@ class ConfigFile(object):
 
 
 class ServoConfiFile(object):
-    def __init__(self, configfile: str, servo_ctl: object) -> dict:
+
+    __slots__ = ("configfile", "config", "data", "servos")
+
+    def __init__(
+        self,
+        configfile: str,
+        servo_ctl: object,
+        data: tuple[bytes, list] | None = None,
+        cached: dict | None = None,
+    ) -> dict:
         self.configfile = configfile
-        self.data = self.load()
+        self.data = self.load(data, cached)
         # provide the servolib to the servos
         Servos.Servo.servo_ctl = servo_ctl
 
-    def load(self) -> dict:
-        """Load servo information from config file and return dict of servo objects"""
-        yaml = YAML()
-        config_schema = Schema(
-            {
-                And(
-                    str, Regex(r"^[A-R]$"), error="lettermap needs to be A through R"
-                ): {
-                    "channel": And(
-                        int,
-                        lambda n: 0 <= n <= 17,
-                        error="channel needs to be between 0 and 17",
-                    ),
-                    "designation": And(
-                        str,
-                        lambda n: len(n) < 5,
-                        error="designation too long <5 characters",
-                    ),
-                    "description": And(
-                        str,
-                        lambda n: len(n) < 30,
-                        error="description too long, <30 characters",
-                    ),
-                    "max_us": And(
-                        int,
-                        lambda n: 300 <= n <= 3000,
-                        error="_us entries need to be between 300 and 3000",
-                    ),
-                    "min_us": And(
-                        int,
-                        lambda n: 300 <= n <= 3000,
-                        error="_us entries need to be between 300 and 3000",
-                    ),
-                    Optional("max_deg"): And(
-                        float,
-                        lambda n: 0 <= n <= 180,
-                        error="_deg entries need to be between 0.0 and 180.0",
-                    ),
-                    Optional("min_deg"): And(
-                        float,
-                        lambda n: 0 <= n <= 180,
-                        error="_deg entries need to be between 0.0 and 180.0",
-                    ),
-                    "angle1_us": And(
-                        int,
-                        lambda n: 300 <= n <= 3000,
-                        error="_us entries need to be between 300 and 3000",
-                    ),
-                    "angle1_deg": And(
-                        float,
-                        lambda n: 0 <= n <= 180,
-                        error="_deg entries need to be between 0.0 and 180.0",
-                    ),
-                    "angle2_us": And(
-                        int,
-                        lambda n: 300 <= n <= 3000,
-                        error="_us entries need to be between 300 and 3000",
-                    ),
-                    "angle2_deg": And(
-                        float,
-                        lambda n: 0 <= n <= 180,
-                        error="_deg entries need to be between 0.0 and 180.0",
-                    ),
-                    "home_deg": And(
-                        float,
-                        lambda n: 0 <= n <= 180,
-                        error="_deg entries need to be between 0.0 and 180.0",
-                    ),
-                }
-            }
-        )
+    def load(
+        self, data: tuple[bytes, list] | None = None, cached: dict | None = None
+    ) -> dict:
+        """Load servo information from config file and return dict of servo objects
 
-        with open(self.configfile) as fd:
-            config = yaml.load(fd)
+        data is the already-read (contents, stamp) of the config file, as returned
+        by read_stamped()/read_files(), if available.  cached is the result of an
+        earlier read_cache_if_current(), if any.  Only pre-read the file when that
+        says it needs parsing, the cache isn't checked again.
+        """
+        if data is None:
+            # Fast path, the config hasn't changed since it was last validated
+            if cached is None:
+                cached = self._read_cache()
+            if cached is not None:
+                servos = {}
+                for lettermap, entry in cached.items():
+                    servos[lettermap] = Servos.Servo(lettermap, **entry)
+                self.config = None
+                self.servos = servos
+                return servos
 
-        try:
-            config_schema.validate(config)
-        except SchemaError as se:
-            sys.exit(f"{self.configfile}: {se.code}")
+            # one buffered read, then parse from memory
+            data = read_stamped(self.configfile)
+        contents, stamp = data
+        config = _YAML_SAFE.load(contents)
+
+        if not isinstance(config, dict):
+            sys.exit(f"{self.configfile}: expected a mapping of lettermaps to servos")
 
-        # Build servo objects
+        # Validate each entry and build its servo object in one pass
         servos = {}
-        for i in config.keys():
-            servos[i] = Servos.Servo(i, **config[i])
+        for lettermap, entry in config.items():
+            _validate_servo_entry(self.configfile, lettermap, entry)
+            servos[lettermap] = Servos.Servo(lettermap, **entry)
 
-        # In order to preserve yaml comments, store a copy of the yaml config
-        # and a reference to the dictionary of servos.
-        self.config = config
+        # the round-trip yaml (with comments) is only needed by save(), which
+        # reads it on first use
+        self.config = None
         self.servos = servos
 
+        self._write_cache(config, stamp)
+
         return servos
 
+    @property
+    def cachefile(self) -> str:
+        """JSON sidecar holding the last validated contents of the config file"""
+        return self.cachefile_for(self.configfile)
+
+    @staticmethod
+    def cachefile_for(configfile: str) -> str:
+        """Name of the cache sidecar for configfile"""
+        return f"{configfile}.cache.json"
+
+    def _read_cache(self) -> dict | None:
+        """Return the cached servo entries, or None if missing or out of date"""
+        return self.read_cache_if_current(self.configfile)
+
+    @classmethod
+    def read_cache_if_current(cls, configfile: str) -> dict | None:
+        """Return the cached servo entries for configfile, or None if missing or
+        out of date
+
+        A result can be handed to ServoConfiFile via its cached parameter so the
+        cache isn't read a second time.
+        """
+        try:
+            cache = json.loads(Path(cls.cachefile_for(configfile)).read_bytes())
+            if cache["version"] != _CACHE_VERSION:
+                return None
+            if cache["source"] != _stamp(os.stat(configfile)):
+                return None
+            return cache["servos"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_cache(self, config: dict, stamp: list) -> None:
+        """Save the validated config so the next load can skip yaml and schema
+
+        stamp identifies the version of the file config was parsed from.
+        """
+        cache = {"version": _CACHE_VERSION, "source": stamp, "servos": config}
+        try:
+            Path(self.cachefile).write_text(json.dumps(cache))
+        except OSError:
+            # a cache we can't write just means the next load takes the slow path
+            pass
+
     def save(self) -> None:
-        yaml = YAML()
-        now = datetime.now().replace(microsecond=0)
+        if self.config is None:
+            # re-read the file in round-trip mode to keep its comments intact
+            self.config = _YAML.load(Path(self.configfile).read_bytes())
+
+        now = datetime.now().replace(microsecond=0).isoformat(sep=" ")
 
         self.config.yaml_set_start_comment(
-            "This file automatically generated on {} by spotbot config".format(now)
+            f"This file automatically generated on {now} by spotbot config"
         )
 
         # update the config with any changes
         for servo in self.servos.values():
-            for attr in [
-                "channel",
-                "description",
-                "designation",
-                "max_us",
-                "min_us",
-                "max_deg",
-                "min_deg",
-                "home_deg",
-                "angle1_us",
-                "angle1_deg",
-                "angle2_us",
-                "angle2_deg",
-            ]:
-                self.config[servo.lettermap][attr] = getattr(servo, attr)
-
-        # write the config
-        with open(self.configfile, "w") as fd:
-            yaml.dump(self.config, fd)
+            target = self.config[servo.lettermap]
+            for attr in _SAVE_FIELDS:
+                target[attr] = getattr(servo, attr)
+
+        # Dump into memory and write the file in one go rather than letting the
+        # emitter write node by node.  Write to a temporary file and swap it in
+        # so an interrupted save can't leave a truncated config behind.
+        buf = io.BytesIO()
+        _YAML.dump(self.config, buf)
+        tmpfile = f"{self.configfile}.tmp"
+        Path(tmpfile).write_bytes(buf.getvalue())
+        os.replace(tmpfile, self.configfile)
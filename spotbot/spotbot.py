@@ -1,7 +1,8 @@
 from textual.app import App, ComposeResult
 from textual.containers import Container, Grid, Horizontal
-from textual.widgets import Footer, Header, Static, Button, Placeholder
+from textual.widgets import Header, Static, Button, Placeholder
 from .Widgets.body import Body
+from .Widgets.footer import Footer
 from .Widgets.status import Status
 from .Widgets.dialog import Dialog
 from .Widgets.menu import Menu
@@ -9,22 +10,35 @@ from textual.screen import Screen
 from textual.binding import Binding, Bindings
 from textual import log
 from textual.reactive import var
+import textual.actions
 from rich.text import Text
 
 from . import file_utils
+from . import Servos
 from . import GPIO as gpio
 from . import add_menus
-from .utils import Utils
+from .utils import Utils, clock_str
 
+from collections import deque
+from typing import Iterable
 import sys
 
-# atexit allows for registering exit handlers, allows us to ensure GPIO conneciton
-# gets closed on exit.
-import atexit
+# Confirmation actions, bound at class creation and again on every relay toggle.
+# Parsed once here, Textual dispatches a parsed (name, params) action directly
+# rather than re-parsing the string on every key press.
+QUIT_ACTION = textual.actions.parse(
+    "confirm_y_n('[bold]Quit?[/bold] Y/N', 'quit', 'close_dialog', '[Quit]')"
+)
+ENABLE_SERVOS_ACTION = textual.actions.parse(
+    "confirm_y_n('[b]Enable Servos?[/b] Y/N', 'toggle_relay', "
+    "'close_dialog', '[Enable Servos]')"
+)
 
-import rich
-import argparse
-import importlib
+# describe the display table layout, one tuple of rows per table, None is a spacer
+SERVO_LAYOUT = (
+    ("A", "B", "C", None, "D", "E", "F"),
+    ("G", "H", "I", None, "J", "K", "L"),
+)
 
 
 class Spotbot(App):
@@ -37,24 +51,10 @@ class Spotbot(App):
         Binding(
             key="full_stop", action="main_menu", description="Menu", key_display="."
         ),
-        (
-            "q",
-            "confirm_y_n('[bold]Quit?[/bold] Y/N', 'quit', 'close_dialog', '[Quit]')",
-            "Quit",
-        ),
-        (
-            "backslash",
-            (
-                "confirm_y_n('[b]Enable Servos?[/b] Y/N', 'toggle_relay', "
-                "'close_dialog', '[Enable Servos]')"
-            ),
-            "Enable Servos",
-        ),
+        ("q", QUIT_ACTION, "Quit"),
+        ("backslash", ENABLE_SERVOS_ACTION, "Enable Servos"),
     ]
 
-    status_stack = []
-    menu_stack = []
-
     def __init__(self, *args, **kwargs) -> None:
         log(sys.argv)
         self.parse_args_and_initialize()
@@ -71,9 +71,26 @@ class Spotbot(App):
         # Dict to store servo data
         self.servo_data = {}
 
+        # saved status/bindings and menus, per instance rather than shared.  Modals
+        # nest a level or two, the bound keeps a runaway push from growing forever
+        self.status_stack = deque(maxlen=8)
+        self.menu_stack = deque()
+
+        # Servos waiting on a coalesced servo_data refresh, see queue_servo_refresh
+        self._pending_servos: set[str] = set()
+        self._flush_timer = None
+
         super().__init__(*args, **kwargs)
 
     def parse_args_and_initialize(self):
+        # only needed once at startup, keep them out of the module import
+        import argparse
+        import importlib
+
+        # atexit allows for registering exit handlers, allows us to ensure GPIO
+        # conneciton gets closed on exit.
+        import atexit
+
         DEFAULT_CONFIG = "config.yml"
 
         parser = argparse.ArgumentParser()
@@ -117,9 +134,24 @@ class Spotbot(App):
         print(f"Received unknown args: {unknown}")
 
         if args.verbose is True:  # smart errors
+            import rich.traceback
+
             rich.traceback.install(show_locals=True)
 
-        configfile = file_utils.ConfigFile(args.config)
+        # If the servo config was given on the command line, both files are known
+        # up front and can be read together, otherwise its name comes from the
+        # main config.  A servo config with a current cache isn't read at all.
+        config_data, servo_config_data, servo_cached = None, None, None
+        if args.servoconfig is not None:
+            servo_cached = file_utils.ServoConfiFile.read_cache_if_current(
+                args.servoconfig
+            )
+            if servo_cached is None:
+                (config_data, _stamp), servo_config_data = file_utils.read_files(
+                    args.config, args.servoconfig
+                )
+
+        configfile = file_utils.ConfigFile(args.config, config_data)
 
         if args.servoconfig is None:
             args.servoconfig = configfile.config["servo_config"]
@@ -151,23 +183,25 @@ class Spotbot(App):
 
         # load servo configuration file
         self.servo_configfile = file_utils.ServoConfiFile(
-            args.servoconfig, self.servo_ctl
+            args.servoconfig, self.servo_ctl, servo_config_data, servo_cached
         )
-        self.servos = self.servo_configfile.load()
+        self.servos = self.servo_configfile.servos
 
     def run(self, *args, **kwargs):
         try:
             super().run(*args, **kwargs)
-        # naked exception to catch any failure and ensure we shut down the relay
-        except:  # noqa E722
+        finally:
+            # however the app exits, make sure the relay is shut down
             if self.relay is not None:
                 self.relay.close()
-            raise
 
     def loadargs(self, **kwargs) -> None:
-        """Transform kwargs into self.arg values"""
-        for (k, v) in kwargs.items():
-            setattr(self, k, v)
+        """Transform kwargs into self.arg values
+
+        Writes straight to the instance dict, so reactive attributes (which are
+        descriptors) must be assigned explicitly rather than passed in here.
+        """
+        self.__dict__.update(kwargs)
 
     def push_status(self) -> None:
         """Save current status and bindings"""
@@ -177,18 +211,13 @@ class Spotbot(App):
     def pop_status(self) -> None:
         """Restore last status and bindings"""
         # hack - changing bindings not currently supported in Textual
-        if len(self.status_stack) > 0:
+        if self.status_stack:
             (self._bindings) = self.status_stack.pop()
 
     def compose(self) -> ComposeResult:
-        # describe the display table layout
-        servo_layout = [
-            ["A", "B", "C", None, "D", "E", "F"],
-            ["G", "H", "I", None, "J", "K", "L"],
-        ]
         self.dialog = Dialog(id="modal_dialog")
         self.footer = Footer()
-        self.body = Body(servo_layout, id="p1")
+        self.body = Body(SERVO_LAYOUT, id="p1")
         self.status = Status(id="status")
         self.menu = Menu(id="menu")
 
@@ -216,17 +245,17 @@ class Spotbot(App):
 
     def on_mount(self) -> None:
         # Set the text of the dialog message and buttons
+        # relay and mode only change in their toggle actions, which update these
+        # entries, so they hold plain strings rather than being polled
         self.status.add_entry(
             key="servo",
             keymsg="Servo Relay",
-            value=lambda: "[r]On[/r] :warning-emoji: "
-            if self.relay.is_active()
-            else "Off",
+            value=self._relay_status_text(),
         )
         self.status.add_entry(
             key="mode",
             keymsg="Mode",
-            value=lambda: "∠" if self.servo_mode == "angle" else "µs",
+            value="∠" if self.servo_mode == "angle" else "µs",
         )
         self.status.update_entry("mode", highlight_value=True)
 
@@ -262,9 +291,9 @@ class Spotbot(App):
         self.status.update_status()
 
         # load the servo tables with the current servo data
-        for servoletter in [chr(i) for i in range(ord("A"), ord("R"))]:
-            if servoletter in self.servos:
-                self.refresh_servo_data(servoletter)
+        for servoletter in self.servos:
+            self._update_servo_data(servoletter)
+        self.body.update_servos(self.servo_data)
 
         # load the menus
         add_menus.add_menus(self.menu)
@@ -274,78 +303,120 @@ class Spotbot(App):
 
     def refresh_servo_data(self, servoletter: str) -> None:
         """Update the servo data table for a specific servo"""
+        self.refresh_servo_data_bulk((servoletter,))
+
+    def refresh_servo_data_bulk(self, servoletters: Iterable[str]) -> None:
+        """Update the servo data table for several servos, then the body once"""
+        if self.body.disabled:
+            # behind a dialog or menu, catch up once the body is enabled again
+            self._pending_servos.update(servoletters)
+            return
+        changed = {
+            servoletter: self.servo_data[servoletter]
+            for servoletter in servoletters
+            if self._update_servo_data(servoletter)
+        }
+        if changed:
+            self.body.update_cells(changed)
+
+    def queue_servo_refresh(self, servoletters: Iterable[str]) -> None:
+        """Refresh the servo data table for servos shortly, coalescing repeats
+
+        Held increment/decrement keys move the servos on every key repeat, the
+        table only needs to catch up once they settle.
+        """
+        self._pending_servos.update(servoletters)
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(0.04, self._flush_servo_data)
+
+    def _flush_servo_data(self) -> None:
+        """Refresh the queued servos in the body"""
+        self._flush_timer = None
+        pending, self._pending_servos = self._pending_servos, set()
+        self.refresh_servo_data_bulk(pending)
+
+    def _update_servo_data(self, servoletter: str) -> bool:
+        """Rebuild the servo data table entry for a specific servo
+
+        Returns False if the entry is unchanged, so the body can be left alone.
+        """
         servo = self.servos[servoletter]
-        self.servo_data[servoletter] = (
+        mapping = (
             servoletter,
             servo.description,
             servo.designation,
-            str(servo.position_us),
-            str(servo.home_deg),
+            servo.position_us_str,
+            servo.home_deg_str,
         )
-        self.body.update_servos(self.servo_data)
+        if self.servo_data.get(servoletter) == mapping:
+            return False
+        self.servo_data[servoletter] = mapping
+        return True
 
     ###########
     # Actions #
     ###########
 
     async def action_toggle_servo_mode(self) -> None:
-        if self.servo_mode == "angle":
-            self.servo_mode = "us"
-            self.status.update_entry("mode", "µs")
-            self.status.update_entry(
-                "angle_increment", highlight_key=False, highlight_value=False
-            )
-            self.status.update_entry(
-                "us_increment", highlight_key=True, highlight_value=True
-            )
-        else:
-            self.servo_mode = "angle"
-            self.status.update_entry("mode", "∠")
-            self.status.update_entry(
-                "us_increment", highlight_key=False, highlight_value=False
-            )
-            self.status.update_entry(
-                "angle_increment", highlight_key=True, highlight_value=True
-            )
+        with self.status.batch_update():
+            if self.servo_mode == "angle":
+                self.servo_mode = "us"
+                self.status.update_entry("mode", "µs")
+                self.status.update_entry(
+                    "angle_increment", highlight_key=False, highlight_value=False
+                )
+                self.status.update_entry(
+                    "us_increment", highlight_key=True, highlight_value=True
+                )
+            else:
+                self.servo_mode = "angle"
+                self.status.update_entry("mode", "∠")
+                self.status.update_entry(
+                    "us_increment", highlight_key=False, highlight_value=False
+                )
+                self.status.update_entry(
+                    "angle_increment", highlight_key=True, highlight_value=True
+                )
 
-        self.status.update_status()
         await self.menu.pop_menu(pop_all=True)
 
         # Refresh bindings if needed
         if len(self.body.selection) != 0:
-            symbol = "∠" if self.servo_mode == "angle" else "µs"
-            self.body.bind("up", "servo_increment", f"Increment {symbol}")
-            self.body.bind("down", "servo_decrement", f"Decrement {symbol}")
-            # self.footer.regenerate()
+            self.body.bind_servo_keys()
+            self.body.refresh_footer()
+
+    async def action_read_servo_positions(self) -> None:
+        """Resync the servo positions with what the controller reports"""
+        for servo in self.servos.values():
+            servo.read_position_us()
+        await self.menu.pop_menu(pop_all=True)
+        self.refresh_servo_data_bulk(self.servos)
 
     def action_servo_increment(self) -> None:
-        for servoletter in self.body.selection:
-            if self.servo_mode == "us":
-                self.servos[servoletter].position_us = (
-                    self.servos[servoletter].position_us + self.us_increment
-                )
-            else:
-                self.servos[servoletter].position_angle = (
-                    self.servos[servoletter].position_angle + self.angle_increment
-                )
-            self.refresh_servo_data(servoletter)
+        self._step_selection(1)
 
     def action_servo_decrement(self) -> None:
-        for servoletter in self.body.selection:
-            if self.servo_mode == "us":
-                self.servos[servoletter].position_us = (
-                    self.servos[servoletter].position_us - self.us_increment
-                )
-            else:
-                self.servos[servoletter].position_angle = (
-                    self.servos[servoletter].position_angle - self.angle_increment
-                )
-            self.refresh_servo_data(servoletter)
+        self._step_selection(-1)
+
+    def _step_selection(self, direction: int) -> None:
+        """Move each selected servo one increment in direction (1 or -1)"""
+        servos = self.servos
+        selection = self.body.selection
+        # the mode can't change mid-loop, pick the branch once
+        if self.servo_mode == "us":
+            step = self.us_increment * direction
+            for servoletter in selection:
+                servos[servoletter].position_us += step
+        else:
+            step = self.angle_increment * direction
+            for servoletter in selection:
+                servos[servoletter].position_angle += step
+        self.queue_servo_refresh(selection)
 
     def action_servo_off(self) -> None:
-        for servoletter in self.body.selection:
-            self.servos[servoletter].stop()
-            self.refresh_servo_data(servoletter)
+        selection = list(self.body.selection)
+        Servos.Servo.stop_many([self.servos[servoletter] for servoletter in selection])
+        self.queue_servo_refresh(selection)
 
     def _action_toggle_relay(self) -> None:
         self.relay.toggle()
@@ -355,18 +426,19 @@ class Spotbot(App):
             self.app.bind("backslash", "toggle_relay", description="Disable Servos")
         else:
             self.app.bind(
-                "backslash",
-                (
-                    "confirm_y_n('[b]Enable Servos?[/b] Y/N', 'toggle_relay', "
-                    "'close_dialog', '[Enable Servos]')"
-                ),
-                description="Enable Servos",
+                "backslash", ENABLE_SERVOS_ACTION, description="Enable Servos"
             )
-            self.footer._key_text = None
-            self.footer.refresh()
+            self.footer.regenerate()
         # update the status bar
+        self.status.update_entry("servo", self._relay_status_text())
         self.status.update_status()
 
+    def _relay_status_text(self) -> str:
+        """Status bar text for the servo relay"""
+        if self.relay is not None and self.relay.is_active():
+            return "[r]On[/r] :warning-emoji: "
+        return "Off"
+
     def _action_main_menu(self) -> None:
         """Launch the main menu"""
         self.menu.load_menu("main")
@@ -393,11 +465,12 @@ class Spotbot(App):
             self.body.disabled = True
         else:
             self.body.disabled = False
+            if self._pending_servos:
+                self._flush_servo_data()
 
     async def on_menu_focus_message(self, message: Menu.FocusMessage) -> None:
         await self.on_dialog_focus_message(message)
-        self.footer._key_text = None
-        self.footer.refresh()
+        self.footer.regenerate()
 
     def unbind(self, key: str) -> None:
         """Create unbind method - hack - not currently supported in Textual
@@ -406,18 +479,26 @@ class Spotbot(App):
         key : str
             key to unbind
         """
-        # Raise exception if key doesn't exist
-        self._bindings.get_key(key)
-        del self._bindings.keys[key]
+        try:
+            del self._bindings.keys[key]
+        except KeyError:
+            raise KeyError(f"No binding for key {key!r}") from None
 
 
 def clocktime() -> str:
-    from datetime import datetime
-
-    return datetime.now().strftime("%H:%M:%S")
+    return clock_str("%H:%M:%S")
 
 
 def main() -> None:
+    # uvloop's scheduling is noticeably cheaper on key-repeat heavy input, use it
+    # when installed (pip install spotbot[uvloop])
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
+
     Spotbot().run()
 
 
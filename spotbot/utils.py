@@ -1,4 +1,17 @@
-from datetime import datetime
+import time
+
+# format -> (second, formatted time) of the last clock string built
+_clock_cache = {}
+
+
+def clock_str(fmt: str) -> str:
+    """Current local time formatted with fmt, only reformatted once a second"""
+    now = int(time.time())
+    cached = _clock_cache.get(fmt)
+    if cached is None or cached[0] != now:
+        cached = (now, time.strftime(fmt, time.localtime(now)))
+        _clock_cache[fmt] = cached
+    return cached[1]
 
 
 def set_us_increment(increment: int) -> None:
@@ -14,16 +27,30 @@ def set_angle_increment(increment: float) -> None:
 
 
 class Utils(object):
+
+    __slots__ = ("parent", "_us_cache", "_angle_cache")
+
     def __init__(self, parent):
         self.parent = parent
 
+        # (increment, formatted str) of the last value formatted, the status
+        # polls these on every update but the increments rarely change
+        self._us_cache = (None, None)
+        self._angle_cache = (None, None)
+
     def get_us_increment(self) -> str:
         """Get current µs incrment as a str"""
-        return "{:>4}".format(str(self.parent.us_increment))
+        increment = self.parent.us_increment
+        if increment != self._us_cache[0]:
+            self._us_cache = (increment, "{:>4}".format(str(increment)))
+        return self._us_cache[1]
 
     def get_angle_increment(self) -> str:
         """Get current µs incrment as a str"""
-        return "{:>5}".format(str(self.parent.angle_increment))
+        increment = self.parent.angle_increment
+        if increment != self._angle_cache[0]:
+            self._angle_cache = (increment, "{:>5}".format(str(increment)))
+        return self._angle_cache[1]
 
     def is_relay_on_off(self) -> str:
         if self.parent.relay.is_active() is True:
@@ -41,4 +68,4 @@ class Utils(object):
         return 1502
 
     def status_clock(self) -> str:
-        return f"{datetime.now().time().strftime('%X')}"
+        return clock_str("%X")
@@ -0,0 +1,287 @@
+import json
+import os
+
+import pytest
+
+from spotbot import file_utils
+
+CONFIGFILE = "servo_config.yml"
+
+
+def servo_entry(**changes):
+    entry = {
+        "channel": 4,
+        "description": "Front-LEFT-Top",
+        "designation": "S4",
+        "max_us": 1936,
+        "min_us": 592,
+        "max_deg": 180.0,
+        "min_deg": 0.0,
+        "home_deg": 90.0,
+        "angle1_us": 300,
+        "angle1_deg": 0.0,
+        "angle2_us": 300,
+        "angle2_deg": 0.0,
+    }
+    entry.update(changes)
+    return entry
+
+
+def exit_message(lettermap, entry):
+    with pytest.raises(SystemExit) as excinfo:
+        file_utils._validate_servo_entry(CONFIGFILE, lettermap, entry)
+    return excinfo.value.code
+
+
+def test_valid_entry():
+    file_utils._validate_servo_entry(CONFIGFILE, "A", servo_entry())
+
+
+def test_optional_fields_may_be_missing():
+    entry = servo_entry()
+    del entry["max_deg"]
+    del entry["min_deg"]
+    file_utils._validate_servo_entry(CONFIGFILE, "A", entry)
+
+
+@pytest.mark.parametrize("lettermap", ["S", "a", "AB", "", 1, None])
+def test_bad_lettermap(lettermap):
+    assert (
+        exit_message(lettermap, servo_entry())
+        == "servo_config.yml: lettermap needs to be A through R"
+    )
+
+
+def test_entry_not_a_mapping():
+    assert (
+        exit_message("A", [1, 2])
+        == "servo_config.yml: A: expected a mapping of servo settings"
+    )
+
+
+@pytest.mark.parametrize(
+    "field, error",
+    [
+        ("channel", "channel needs to be between 0 and 17"),
+        ("max_us", "_us entries need to be between 300 and 3000"),
+    ],
+)
+def test_bool_not_accepted_as_int(field, error):
+    # bool is an int subclass, schema rejected it and so should we
+    assert exit_message("A", servo_entry(**{field: True})) == (
+        f"servo_config.yml: A: {error}"
+    )
+
+
+@pytest.mark.parametrize(
+    "field, value, error",
+    [
+        ("channel", -1, "channel needs to be between 0 and 17"),
+        ("channel", 18, "channel needs to be between 0 and 17"),
+        ("designation", "S1234", "designation too long <5 characters"),
+        ("description", "x" * 30, "description too long, <30 characters"),
+        ("max_us", 299, "_us entries need to be between 300 and 3000"),
+        ("min_us", 3001, "_us entries need to be between 300 and 3000"),
+        ("angle1_us", 0, "_us entries need to be between 300 and 3000"),
+        ("max_deg", 180.5, "_deg entries need to be between 0.0 and 180.0"),
+        ("home_deg", -0.5, "_deg entries need to be between 0.0 and 180.0"),
+    ],
+)
+def test_out_of_range(field, value, error):
+    assert exit_message("A", servo_entry(**{field: value})) == (
+        f"servo_config.yml: A: {error}"
+    )
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("channel", 0),
+        ("channel", 17),
+        ("designation", "S123"),
+        ("description", "x" * 29),
+        ("min_us", 300),
+        ("max_us", 3000),
+        ("min_deg", 0.0),
+        ("max_deg", 180.0),
+    ],
+)
+def test_range_limits_are_inclusive(field, value):
+    file_utils._validate_servo_entry(CONFIGFILE, "A", servo_entry(**{field: value}))
+
+
+@pytest.mark.parametrize(
+    "field, value, error",
+    [
+        ("channel", "4", "channel needs to be between 0 and 17"),
+        ("channel", 4.0, "channel needs to be between 0 and 17"),
+        ("designation", 4, "designation too long <5 characters"),
+        ("max_us", 1936.0, "_us entries need to be between 300 and 3000"),
+        ("home_deg", 90, "_deg entries need to be between 0.0 and 180.0"),
+        ("angle2_deg", None, "_deg entries need to be between 0.0 and 180.0"),
+    ],
+)
+def test_wrong_type(field, value, error):
+    assert exit_message("A", servo_entry(**{field: value})) == (
+        f"servo_config.yml: A: {error}"
+    )
+
+
+def test_missing_key():
+    entry = servo_entry()
+    del entry["home_deg"]
+    assert exit_message("A", entry) == "servo_config.yml: A: missing key 'home_deg'"
+
+
+def test_extra_key():
+    assert (
+        exit_message("A", servo_entry(speed=10))
+        == "servo_config.yml: A: unexpected key 'speed'"
+    )
+
+
+SERVO_YAML = """\
+A:
+  channel: 4  # front left top
+  description: Front-LEFT-Top
+  designation: S4
+  max_us: 1936
+  min_us: 592
+  home_deg: 90.0
+  angle1_us: 300
+  angle1_deg: 0.0
+  angle2_us: 300
+  angle2_deg: 0.0
+"""
+
+
+class NoYAML(object):
+    """Stands in for the safe loader when a load must come from the cache"""
+
+    def load(self, data):
+        raise AssertionError("servo config was parsed, expected a cache hit")
+
+
+@pytest.fixture
+def servo_config(tmp_path):
+    path = tmp_path / "servo_config.yml"
+    path.write_text(SERVO_YAML)
+    return str(path)
+
+
+def load(configfile, data=None):
+    return file_utils.ServoConfiFile(configfile, None, data)
+
+
+def test_cache_written_on_first_load(servo_config):
+    assert file_utils.ServoConfiFile.read_cache_if_current(servo_config) is None
+    load(servo_config)
+    assert file_utils.ServoConfiFile.read_cache_if_current(servo_config) is not None
+
+
+def test_cache_hit(servo_config, monkeypatch):
+    load(servo_config)
+    monkeypatch.setattr(file_utils, "_YAML_SAFE", NoYAML())
+    servo_configfile = load(servo_config)
+    assert servo_configfile.config is None
+    servo = servo_configfile.servos["A"]
+    assert (servo.channel, servo.description, servo.min_us) == (
+        4,
+        "Front-LEFT-Top",
+        592,
+    )
+
+
+def test_cache_passed_in_is_used(servo_config, monkeypatch):
+    load(servo_config)
+    cached = file_utils.ServoConfiFile.read_cache_if_current(servo_config)
+
+    def no_reread(cls, configfile):
+        raise AssertionError("cache read again")
+
+    monkeypatch.setattr(
+        file_utils.ServoConfiFile, "read_cache_if_current", classmethod(no_reread)
+    )
+    monkeypatch.setattr(file_utils, "_YAML_SAFE", NoYAML())
+    servo_configfile = file_utils.ServoConfiFile(servo_config, None, cached=cached)
+    assert servo_configfile.servos["A"].description == "Front-LEFT-Top"
+
+
+def test_stale_stamp(servo_config):
+    load(servo_config)
+    with open(servo_config, "w") as f:
+        f.write(SERVO_YAML.replace("Front-LEFT-Top", "Front-LEFT-Upper"))
+    assert file_utils.ServoConfiFile.read_cache_if_current(servo_config) is None
+    assert load(servo_config).servos["A"].description == "Front-LEFT-Upper"
+    assert file_utils.ServoConfiFile.read_cache_if_current(servo_config) is not None
+
+
+def test_stamp_is_from_the_contents_read(servo_config):
+    # pre-read contents, then the file is edited before they are parsed
+    data = file_utils.read_stamped(servo_config)
+    with open(servo_config, "w") as f:
+        f.write(SERVO_YAML.replace("Front-LEFT-Top", "Front-LEFT-Upper"))
+    assert load(servo_config, data).servos["A"].description == "Front-LEFT-Top"
+    # the cache holds the old contents, so it must not pass for the new file
+    assert file_utils.ServoConfiFile.read_cache_if_current(servo_config) is None
+    assert load(servo_config).servos["A"].description == "Front-LEFT-Upper"
+
+
+@pytest.mark.parametrize(
+    "cache",
+    [
+        "not json",
+        "[]",
+        '{"servos": {}}',
+        '{"source": [0, 0], "servos": {}}',
+    ],
+)
+def test_bad_cache_falls_back_to_yaml(servo_config, cache):
+    with open(file_utils.ServoConfiFile.cachefile_for(servo_config), "w") as f:
+        f.write(cache)
+    assert load(servo_config).servos["A"].description == "Front-LEFT-Top"
+    # and the cache is replaced with a good one
+    assert file_utils.ServoConfiFile.read_cache_if_current(servo_config) is not None
+
+
+@pytest.mark.parametrize(
+    "version",
+    [None, file_utils._CACHE_VERSION - 1, file_utils._CACHE_VERSION + 1],
+)
+def test_stale_cache_version_is_reparsed(servo_config, version):
+    load(servo_config)
+    cachefile = file_utils.ServoConfiFile.cachefile_for(servo_config)
+    with open(cachefile) as f:
+        cache = json.load(f)
+    # a current stamp, but an entry that passed older rules (bools used to pass
+    # as ints) and isn't valid under the current ones
+    cache["servos"]["A"]["channel"] = True
+    if version is None:
+        del cache["version"]
+    else:
+        cache["version"] = version
+    with open(cachefile, "w") as f:
+        json.dump(cache, f)
+
+    assert file_utils.ServoConfiFile.read_cache_if_current(servo_config) is None
+    assert load(servo_config).servos["A"].channel == 4
+    assert file_utils.ServoConfiFile.read_cache_if_current(servo_config) is not None
+
+
+def test_unreadable_cache_falls_back_to_yaml(servo_config):
+    # a directory in the way can be neither read nor written as the cache
+    os.mkdir(file_utils.ServoConfiFile.cachefile_for(servo_config))
+    assert load(servo_config).servos["A"].description == "Front-LEFT-Top"
+    assert file_utils.ServoConfiFile.read_cache_if_current(servo_config) is None
+
+
+def test_save_after_cache_hit_keeps_comments(servo_config):
+    load(servo_config)
+    servo_configfile = load(servo_config)
+    assert servo_configfile.config is None
+    servo_configfile.servos["A"].home_deg = 45.0
+    servo_configfile.save()
+    with open(servo_config) as f:
+        saved = f.read()
+    assert "channel: 4  # front left top" in saved
+    assert "home_deg: 45.0" in saved
@@ -0,0 +1,63 @@
+import pytest
+
+from spotbot.Servos import Servo
+
+
+class FakeServoCtl(object):
+    """Records targets instead of talking to a controller"""
+
+    def __init__(self):
+        self.targets = {}
+
+    def get_position_us(self, channel):
+        return self.targets.get(channel, 1500.0)
+
+    def set_target_us(self, channel, target_us):
+        self.targets[channel] = target_us
+
+    def stop_channel(self, channel):
+        self.targets[channel] = 0
+
+
+@pytest.fixture
+def servo(monkeypatch):
+    monkeypatch.setattr(Servo, "servo_ctl", FakeServoCtl())
+    return Servo("A", 4, "Front-LEFT-Top", max_us=1936, min_us=592)
+
+
+@pytest.mark.parametrize(
+    "value, expected, expected_str",
+    [
+        (5000, 1936.0, "1936.0"),
+        (1936, 1936.0, "1936.0"),
+        (100, 592.0, "592.0"),
+        (592, 592.0, "592.0"),
+        (1801, 1801.0, "1801.0"),
+        (1801.5, 1801.5, "1801.5"),
+    ],
+)
+def test_position_us_clamped_to_limits(servo, value, expected, expected_str):
+    servo.position_us = value
+    assert servo.position_us == expected
+    assert isinstance(servo.position_us, float)
+    assert servo.servo_ctl.targets[4] == expected
+    assert servo.position_us_str == expected_str
+
+
+def test_position_us_zero_is_off(servo):
+    servo.position_us = 0
+    assert servo.position_us == 0.0
+    assert servo.servo_ctl.targets[4] == 0.0
+    assert servo.position_us_str == "0.0"
+
+
+def test_position_us_str_follows_clamped_value(servo):
+    # an int and float of the same value compare equal, so an int read back from
+    # the controller would otherwise stay on display after a clamp
+    servo.servo_ctl.targets[4] = 1936
+    assert servo.position_us_str == "1936.0"
+    servo.position_us = 5000
+    assert servo.position_us_str == "1936.0"
+    servo.servo_ctl.targets[4] = 592
+    assert servo.read_position_us() == 592.0
+    assert servo.position_us_str == "592.0"